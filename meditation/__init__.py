@@ -1,127 +1,335 @@
 import discord
-from discord.ext import tasks
 import sqlite3
 import datetime
-import pytz
+from datetime import timezone
 from typing import Optional
 import asyncio
+import collections
 import json
 import os
+import threading
 from redbot.core import commands
 from redbot.core.data_manager import cog_data_path
 import logging
 
 log = logging.getLogger("red.meditation")
 
+_UTC = timezone.utc
+_MED_EMOJI = frozenset(("🧘\u200d♂\ufe0f", "🧘\u200d♀\ufe0f"))
+
 class MeditationCog(commands.Cog):
     """A cog for tracking daily meditation practices."""
 
+    MESSAGE_CACHE_SIZE = 64
+    WRITE_BATCH_DELAY = 0.25  # seconds to coalesce queued writes
+    WRITE_RETRY_DELAY = 5  # seconds to wait before retrying a failed batch
+    POST_RETRY_DELAY = 60  # seconds between attempts at a missed daily post
+    POST_OFFSET = 5  # seconds after 7:30 to post, so created_at is never before the cutoff
+
+    # Hot statements. sqlite3 caches prepared statements per connection, keyed
+    # by SQL text (cached_statements), so reusing these exact strings on the
+    # persistent connection skips re-parsing them.
+    SQL_INSERT = '''
+        INSERT OR REPLACE INTO meditation_records (user_id, med_day)
+        VALUES (?, ?)
+    '''
+    SQL_DELETE = '''
+        DELETE FROM meditation_records 
+        WHERE user_id = ? AND med_day = ?
+    '''
+    SQL_STREAK = '''
+        SELECT med_day 
+        FROM meditation_records 
+        WHERE user_id = ? 
+        ORDER BY med_day DESC
+    '''
+    # Consecutive days share the same (med_day - row_number) group, so each
+    # group is one run of days; keep only runs that are still active (last
+    # day is today or yesterday).
+    SQL_LEADERBOARD = '''
+        WITH d AS (
+            SELECT user_id, med_day,
+                   med_day - ROW_NUMBER() OVER (PARTITION BY user_id ORDER BY med_day) AS grp
+            FROM meditation_records
+        )
+        SELECT user_id, COUNT(*) AS streak, MAX(med_day) AS last
+        FROM d
+        GROUP BY user_id, grp
+        HAVING last >= ? - 1
+        ORDER BY streak DESC
+    '''
+
     def __init__(self, bot):
         self.bot = bot
         self.data_dir = f"{cog_data_path(self)}"
         os.makedirs(self.data_dir, exist_ok=True)
         
         self.db_path = os.path.join(self.data_dir, 'meditation.db')
-        self.settings_path = os.path.join(self.data_dir, 'settings.json')
-        self.settings = self.load_settings()
+        self.settings_path = os.path.join(self.data_dir, 'settings.json')  # legacy, migrated into the db
+
+        # Single long-lived connection for the cog lifetime
+        self._db_lock = threading.RLock()
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False, isolation_level=None)
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute('PRAGMA synchronous=NORMAL')
+        self._conn.execute('PRAGMA temp_store=MEMORY')
         self.init_database()
-        self.daily_post.start()
-        self._last_post_attempt = None  # Track when we last tried to post
-        self._post_lock = asyncio.Lock()
+        self.settings = self.load_settings()
+        self._daily_message_hash = hash(self.settings['daily_message'])
+        self._channel_id_int: Optional[int] = int(self.settings['channel_id']) if self.settings.get('channel_id') else None
+        self._channel = None  # resolved lazily from _channel_id_int
+
+        # Reaction writes are queued and flushed in batches
+        self._write_queue: asyncio.Queue = asyncio.Queue()
+        self._pending_writes = []  # taken off the queue but not yet written, oldest first
+        # (user_id, med_day) pairs known to be recorded, loaded per day on demand
+        self._recorded: set[tuple[int, int]] = set()
+        self._recorded_days: set[int] = set()
+        self._flush_task = self.bot.loop.create_task(self._flush_loop())
+        self._scheduler_task = self.bot.loop.create_task(self._scheduler())
+        # Recently seen messages keyed by id, to avoid fetch_message round-trips
+        self._msg_cache: collections.OrderedDict[int, discord.Message] = collections.OrderedDict()
+        # message_id -> user_id -> meditation emojis, for daily messages posted this session
+        self._reactors: dict[int, dict[int, set[str]]] = {}
+
+    def cog_unload(self):
+        self._scheduler_task.cancel()
+        self._flush_task.cancel()
+        try:
+            self.write_batch(self._pending_writes + self._drain_write_queue())
+        finally:
+            with self._db_lock:
+                self._conn.close()
 
     def load_settings(self) -> dict:
-        if os.path.exists(self.settings_path):
-            with open(self.settings_path, 'r') as f:
-                return json.load(f)
-        return {
+        settings = {
             'channel_id': None,
             'daily_message': "React to this message if you've meditated today",
             'last_post_time': None,
             'was_first_post': False
         }
+        with self._db_lock:
+            c = self._conn.cursor()
+            c.execute('SELECT key, value FROM settings')
+            rows = c.fetchall()
+
+        if rows:
+            settings.update((key, json.loads(value)) for key, value in rows)
+        elif os.path.exists(self.settings_path):
+            # One-time import of settings from the old JSON file
+            with open(self.settings_path, 'r') as f:
+                settings.update(json.load(f))
+            self.settings = settings
+            self.save_settings()
+            log.info("Migrated settings.json into the database")
+        return settings
 
     def save_settings(self):
-        with open(self.settings_path, 'w') as f:
-            json.dump(self.settings, f)
+        self._daily_message_hash = hash(self.settings['daily_message'])
+        with self._db_lock:
+            c = self._conn.cursor()
+            c.execute('BEGIN IMMEDIATE')
+            try:
+                c.executemany('''
+                    INSERT OR REPLACE INTO settings (key, value)
+                    VALUES (?, ?)
+                ''', [(key, json.dumps(value)) for key, value in self.settings.items()])
+                c.execute('COMMIT')
+            except Exception:
+                c.execute('ROLLBACK')
+                raise
 
     def init_database(self):
-        conn = sqlite3.connect(self.db_path)
-        c = conn.cursor()
-        c.execute('''
-            CREATE TABLE IF NOT EXISTS meditation_records (
-                user_id INTEGER,
-                meditation_date DATE,
-                PRIMARY KEY (user_id, meditation_date)
-            )
-        ''')
-        conn.commit()
-        conn.close()
-
-    def get_meditation_date(self, timestamp: datetime.datetime) -> datetime.date:
-        """Determine which meditation day a timestamp belongs to based on 7:30 AM GMT cutoff"""
-        gmt = timestamp.astimezone(pytz.UTC)
+        with self._db_lock:
+            c = self._conn.cursor()
+            c.execute('PRAGMA table_info(meditation_records)')
+            columns = {row[1] for row in c.fetchall()}
+            if 'meditation_date' in columns:
+                self._migrate_to_med_day(c)
+
+            c.execute('''
+                CREATE TABLE IF NOT EXISTS meditation_records (
+                    user_id INTEGER,
+                    med_day INTEGER,
+                    PRIMARY KEY (user_id, med_day)
+                )
+            ''')
+            c.execute('''
+                CREATE TABLE IF NOT EXISTS settings (
+                    key TEXT PRIMARY KEY,
+                    value TEXT
+                )
+            ''')
+
+    def _migrate_to_med_day(self, c: sqlite3.Cursor):
+        """Rebuild a TEXT meditation_date table keyed by an INTEGER Julian day"""
+        log.info("Migrating meditation_records to integer med_day")
+        c.execute('BEGIN IMMEDIATE')
+        try:
+            c.execute('ALTER TABLE meditation_records RENAME TO meditation_records_old')
+            c.execute('''
+                CREATE TABLE meditation_records (
+                    user_id INTEGER,
+                    med_day INTEGER,
+                    PRIMARY KEY (user_id, med_day)
+                )
+            ''')
+            c.execute('''
+                INSERT OR IGNORE INTO meditation_records (user_id, med_day)
+                SELECT user_id, CAST(julianday(meditation_date) AS INTEGER)
+                FROM meditation_records_old
+            ''')
+            c.execute('DROP TABLE meditation_records_old')
+            c.execute('COMMIT')
+        except Exception:
+            c.execute('ROLLBACK')
+            raise
+
+    def write_batch(self, ops: list):
+        """Apply queued (op, user_id, med_day) writes in one transaction"""
+        if not ops:
+            return
+        with self._db_lock:
+            self._conn.execute('BEGIN IMMEDIATE')
+            try:
+                # Keep queue order, but group consecutive writes of the same kind
+                i = 0
+                while i < len(ops):
+                    op = ops[i][0]
+                    j = i
+                    while j < len(ops) and ops[j][0] == op:
+                        j += 1
+                    rows = [(user_id, day) for _, user_id, day in ops[i:j]]
+                    if op == "insert":
+                        self._conn.executemany(self.SQL_INSERT, rows)
+                    else:
+                        self._conn.executemany(self.SQL_DELETE, rows)
+                    i = j
+                self._conn.execute('COMMIT')
+            except Exception:
+                self._conn.execute('ROLLBACK')
+                raise
+
+    def load_recorded(self, med_day: int):
+        """Load the users recorded for a day into the in-memory set, once per day"""
+        if med_day in self._recorded_days:
+            return
+        # Moving on to a newer day: forget days no message can still change
+        if not self._recorded_days or med_day > max(self._recorded_days):
+            cutoff = med_day - 3
+            self._recorded = {key for key in self._recorded if key[1] >= cutoff}
+            self._recorded_days = {day for day in self._recorded_days if day >= cutoff}
+
+        with self._db_lock:
+            c = self._conn.cursor()
+            c.execute('SELECT user_id FROM meditation_records WHERE med_day = ?', (med_day,))
+            self._recorded.update((row[0], med_day) for row in c.fetchall())
+        self._recorded_days.add(med_day)
+
+    def _drain_write_queue(self) -> list:
+        ops = []
+        while True:
+            try:
+                ops.append(self._write_queue.get_nowait())
+            except asyncio.QueueEmpty:
+                return ops
+
+    async def _flush_loop(self):
+        while True:
+            if not self._pending_writes:
+                self._pending_writes.append(await self._write_queue.get())
+            # Give a burst of reactions a moment to pile up
+            await asyncio.sleep(self.WRITE_BATCH_DELAY)
+            self._pending_writes.extend(self._drain_write_queue())
+            try:
+                self.write_batch(self._pending_writes)
+            except Exception:
+                # Keep the batch (in order) and retry it, so the database
+                # catches up with what _recorded already assumes
+                log.exception(f"Error flushing {len(self._pending_writes)} meditation record writes, retrying")
+                await asyncio.sleep(self.WRITE_RETRY_DELAY)
+                continue
+            log.debug(f"Flushed {len(self._pending_writes)} meditation record writes")
+            self._pending_writes = []
+
+    def get_meditation_date(self, timestamp: datetime.datetime) -> int:
+        """Determine which meditation day a timestamp belongs to based on 7:30 AM GMT cutoff.
+
+        Days are Julian day numbers, matching SQLite's CAST(julianday(date) AS INTEGER).
+        """
+        gmt = timestamp.astimezone(_UTC)
         cutoff = gmt.replace(hour=7, minute=30, second=0, microsecond=0)
+        day = gmt.date().toordinal() + 1721424
         if gmt < cutoff:
-            return gmt.date() - datetime.timedelta(days=1)
-        return gmt.date()
+            return day - 1
+        return day
 
-    def get_streak(self, user_id: int, current_date: datetime.date) -> int:
+    def get_streak(self, user_id: int, current_day: int) -> int:
         """Get the current meditation streak for a user"""
-        conn = sqlite3.connect(self.db_path)
-        c = conn.cursor()
+        with self._db_lock:
+            # Get all days for this user, newest first
+            days = [row[0] for row in self._conn.execute(self.SQL_STREAK, (user_id,)).fetchall()]
         
-        try:
-            # Get all dates for this user, ordered by date
-            c.execute('''
-                SELECT meditation_date 
-                FROM meditation_records 
-                WHERE user_id = ? 
-                ORDER BY meditation_date DESC
-            ''', (user_id,))
-            
-            dates = [datetime.datetime.strptime(row[0], '%Y-%m-%d').date() 
-                    for row in c.fetchall()]
+        # A streak whose last day is before yesterday has ended
+        if not days or days[0] < current_day - 1:
+            return 0
             
-            if not dates:
-                return 0
+        streak = 1
+        prev = days[0]
+        
+        # Check each consecutive day
+        for day in days[1:]:
+            if prev - day == 1:
+                streak += 1
+                prev = day
+            else:
+                break
                 
-            streak = 1
-            expected_date = dates[0]
-            
-            # Check each consecutive date
-            for date in dates[1:]:
-                if expected_date - datetime.timedelta(days=1) == date:
-                    streak += 1
-                    expected_date = date
-                else:
-                    break
-                    
-            return streak
-            
-        finally:
-            conn.close()
+        return streak
 
-    def get_all_streaks(self, current_date: datetime.date) -> dict:
+    def get_all_streaks(self, current_day: int) -> dict:
         """Get current meditation streaks for all users"""
-        conn = sqlite3.connect(self.db_path)
-        c = conn.cursor()
-        
-        try:
-            # Get all unique user IDs
-            c.execute('SELECT DISTINCT user_id FROM meditation_records')
-            user_ids = [row[0] for row in c.fetchall()]
-            
-            # Calculate streak for each user
-            streaks = {}
-            for user_id in user_ids:
-                streak = self.get_streak(user_id, current_date)
-                if streak > 0:
-                    streaks[user_id] = streak
-                    
-            return dict(sorted(streaks.items(), key=lambda x: x[1], reverse=True))
-            
-        finally:
-            conn.close()
+        with self._db_lock:
+            rows = self._conn.execute(self.SQL_LEADERBOARD, (current_day,)).fetchall()
+
+        return {user_id: streak for user_id, streak, _ in rows}
+
+    def cache_message(self, message: discord.Message):
+        """Remember a message, evicting the least recently used one when full"""
+        self._msg_cache[message.id] = message
+        self._msg_cache.move_to_end(message.id)
+        if len(self._msg_cache) > self.MESSAGE_CACHE_SIZE:
+            evicted, _ = self._msg_cache.popitem(last=False)
+            self._reactors.pop(evicted, None)
+
+    def get_meditation_channel(self):
+        """Get the configured meditation channel, looking it up once per session"""
+        if self._channel is None and self._channel_id_int is not None:
+            self._channel = self.bot.get_channel(self._channel_id_int)
+        return self._channel
+
+    async def get_message(self, message_id: int) -> Optional[discord.Message]:
+        """Get a meditation channel message from the cache, fetching it from Discord on a miss"""
+        message = self._msg_cache.get(message_id)
+        if message is not None:
+            self._msg_cache.move_to_end(message_id)
+            return message
+
+        channel = self.get_meditation_channel()
+        if channel is None:
+            return None
+        message = await channel.fetch_message(message_id)
+        self.cache_message(message)
+        return message
+
+    def is_daily_message(self, message: Optional[discord.Message]) -> bool:
+        """Check if a message is one of our daily meditation posts"""
+        return (
+            message is not None
+            and message.author == self.bot.user
+            and hash(message.content) == self._daily_message_hash
+            and message.content == self.settings['daily_message']
+        )
 
     def should_post(self, now: datetime.datetime) -> bool:
         """Determine if we should post the daily message"""
@@ -156,54 +364,70 @@ class MeditationCog(commands.Cog):
             
         return False
 
-    async def post_daily_message(self):
-        """Post the daily meditation message and update settings"""
+    async def post_daily_message(self) -> bool:
+        """Post the daily meditation message and update settings, returning whether it posted"""
         try:
-            channel = self.bot.get_channel(int(self.settings['channel_id']))
+            channel = self.get_meditation_channel()
             if channel:
                 log.info(f"Posting in channel {channel.name} ({channel.id})")
                 message = await channel.send(self.settings['daily_message'])
+                self.cache_message(message)
+                self._reactors[message.id] = {}
                 await message.add_reaction("🧘‍♂️")
                 await message.add_reaction("🧘‍♀️")
                 
                 # Update last post time
-                self.settings['last_post_time'] = datetime.datetime.now(pytz.UTC).isoformat()
+                self.settings['last_post_time'] = datetime.datetime.now(_UTC).isoformat()
                 self.save_settings()
                 log.info(f"Successfully posted message {message.id} and updated settings")
+                return True
             else:
                 log.error(f"Could not find channel with ID {self.settings['channel_id']}")
         except Exception as e:
             log.exception("Error in post_daily_message")
+        return False
 
-    @tasks.loop(minutes=1)
-    async def daily_post(self):
-        try:
-            if self._post_lock.locked():
+    async def _post_missed(self, until: datetime.datetime):
+        """Recovery case: post while should_post says one is due, retrying until the next target time"""
+        while self.settings['channel_id'] and self.should_post(datetime.datetime.now(_UTC)):
+            if await self.post_daily_message():
                 return
-                
-            async with self._post_lock:
-                if not self.settings['channel_id']:
-                    return
+            now = datetime.datetime.now(_UTC)
+            if (until - now).total_seconds() <= self.POST_RETRY_DELAY:
+                return
+            await asyncio.sleep(self.POST_RETRY_DELAY)
 
-                now = datetime.datetime.now(pytz.UTC)
-                
-                # Rate limit check
-                if self._last_post_attempt:
-                    time_since_last = (now - self._last_post_attempt).total_seconds()
-                    if time_since_last < 300:
-                        return
-                
-                self._last_post_attempt = now
-                target_time = now.replace(hour=7, minute=30, second=0, microsecond=0)
-                
-                # Normal case: it's exactly 7:30 AM
-                if now.hour == target_time.hour and now.minute == target_time.minute:
-                    await self.post_daily_message()
-                # Recovery case: check if we missed posting
-                elif self.should_post(now):
-                    await self.post_daily_message()
+    async def _scheduler(self):
+        """Post the daily message at 7:30 AM GMT, sleeping until each target time"""
+        await self.bot.wait_until_ready()
+
+        now = datetime.datetime.now(_UTC)
+        target = now.replace(hour=7, minute=30, second=self.POST_OFFSET, microsecond=0)
+        if target <= now:
+            target += datetime.timedelta(days=1)
+
+        # Check if we missed posting while offline
+        try:
+            await self._post_missed(target)
         except Exception as e:
-            log.exception("Error in daily_post task")
+            log.exception("Error in daily post scheduler")
+
+        while True:
+            try:
+                # A long sleep can wake early, so keep sleeping until the clock agrees
+                while True:
+                    delay = (target - datetime.datetime.now(_UTC)).total_seconds()
+                    if delay <= 0:
+                        break
+                    await asyncio.sleep(delay)
+                target += datetime.timedelta(days=1)
+                if self.settings['channel_id']:
+                    self.settings['was_first_post'] = False
+                    if not await self.post_daily_message():
+                        await self._post_missed(target)
+            except Exception as e:
+                log.exception("Error in daily post scheduler")
+                await asyncio.sleep(self.POST_RETRY_DELAY)
 
     @commands.group(name="med")
     async def med(self, ctx):
@@ -222,17 +446,22 @@ class MeditationCog(commands.Cog):
     async def set_channel(self, ctx):
         self.settings['channel_id'] = str(ctx.channel.id)
         self.save_settings()
+        self._channel_id_int = ctx.channel.id
+        self._channel = ctx.channel
         await ctx.send(f"Meditation channel set to: {ctx.channel.name}")
+        # Post straight away if we never have, rather than waiting for 7:30
+        if self.should_post(datetime.datetime.now(_UTC)):
+            await self.post_daily_message()
 
     @med.command(name="me")
     async def show_streak(self, ctx):
-        today = self.get_meditation_date(datetime.datetime.now(pytz.UTC))
+        today = self.get_meditation_date(datetime.datetime.now(_UTC))
         streak = self.get_streak(ctx.author.id, today)
         await ctx.send(f"You have meditated for {streak} consecutive days!")
 
     @med.command(name="leaderboard")
     async def show_leaderboard(self, ctx):
-        today = self.get_meditation_date(datetime.datetime.now(pytz.UTC))
+        today = self.get_meditation_date(datetime.datetime.now(_UTC))
         top_users = self.get_all_streaks(today)
         
         if not top_users:
@@ -255,72 +484,88 @@ class MeditationCog(commands.Cog):
 
     @commands.Cog.listener()
     async def on_raw_reaction_add(self, payload):
-        if payload.user_id == self.bot.user.id:
+        if payload.channel_id != self._channel_id_int:
             return
 
-        channel = self.bot.get_channel(payload.channel_id)
-        message = await channel.fetch_message(payload.message_id)
-        
-        # Check if reaction is on a meditation message
-        if message.author != self.bot.user or message.content != self.settings['daily_message']:
+        if payload.user_id == self.bot.user.id:
             return
 
         # Check if reaction is one of our meditation emojis
-        if str(payload.emoji) not in ["🧘‍♂️", "🧘‍♀️"]:
+        if payload.emoji.name not in _MED_EMOJI:
+            return
+
+        message = await self.get_message(payload.message_id)
+        
+        # Check if reaction is on a meditation message
+        if not self.is_daily_message(message):
             return
 
         # Check if message is more than 2 days old
-        message_age = datetime.datetime.now(pytz.UTC) - message.created_at
+        message_age = datetime.datetime.now(_UTC) - message.created_at
         if message_age.days > 2:
             await message.remove_reaction(payload.emoji, payload.member)
             return
 
+        reactors = self._reactors.get(message.id)
+        if reactors is not None:
+            reactors.setdefault(payload.user_id, set()).add(payload.emoji.name)
+
         # Record meditation
-        meditation_date = self.get_meditation_date(message.created_at)
-        conn = sqlite3.connect(self.db_path)
-        c = conn.cursor()
-        try:
-            c.execute('''
-                INSERT OR REPLACE INTO meditation_records (user_id, meditation_date)
-                VALUES (?, ?)
-            ''', (payload.user_id, meditation_date))
-            conn.commit()
-        finally:
-            conn.close()
+        med_day = self.get_meditation_date(message.created_at)
+        self.load_recorded(med_day)
+        key = (payload.user_id, med_day)
+        if key in self._recorded:
+            return
+        self._recorded.add(key)
+        self._write_queue.put_nowait(("insert", payload.user_id, med_day))
 
     @commands.Cog.listener()
     async def on_raw_reaction_remove(self, payload):
-        channel = self.bot.get_channel(payload.channel_id)
-        message = await channel.fetch_message(payload.message_id)
-        
-        # Check if reaction is from a meditation message
-        if message.author != self.bot.user or message.content != self.settings['daily_message']:
+        if payload.channel_id != self._channel_id_int:
             return
 
         # Check if the removed reaction was a meditation emoji
-        if str(payload.emoji) not in ["🧘‍♂️", "🧘‍♀️"]:
+        if payload.emoji.name not in _MED_EMOJI:
+            return
+
+        was_cached = payload.message_id in self._msg_cache
+        message = await self.get_message(payload.message_id)
+        
+        # Check if reaction is from a meditation message
+        if not self.is_daily_message(message):
             return
 
         # Check if user still has any meditation reactions on the message
-        user = self.bot.get_user(payload.user_id)
-        for reaction in message.reactions:
-            if str(reaction.emoji) in ["🧘‍♂️", "🧘‍♀️"]:
+        reactors = self._reactors.get(message.id)
+        if reactors is not None:
+            emojis = reactors.get(payload.user_id, set())
+            emojis.discard(payload.emoji.name)
+            if emojis:
+                return
+            reactors.pop(payload.user_id, None)
+        else:
+            # Not posted this session, so ask Discord. Cached messages carry
+            # stale reaction counts, so refetch unless get_message just did,
+            # and only page through users of an emoji someone other than the
+            # bot still has.
+            if was_cached:
+                message = await message.channel.fetch_message(message.id)
+                self.cache_message(message)
+            for reaction in message.reactions:
+                if str(reaction.emoji) not in _MED_EMOJI or reaction.count - reaction.me < 1:
+                    continue
                 async for reaction_user in reaction.users():
                     if reaction_user.id == payload.user_id:
                         return
 
         # If we get here, user has no more meditation reactions, so remove their record
-        meditation_date = self.get_meditation_date(message.created_at)
-        conn = sqlite3.connect(self.db_path)
-        c = conn.cursor()
-        try:
-            c.execute('''
-                DELETE FROM meditation_records 
-                WHERE user_id = ? AND meditation_date = ?
-            ''', (payload.user_id, meditation_date))
-            conn.commit()
-        finally:
-            conn.close()
+        med_day = self.get_meditation_date(message.created_at)
+        self.load_recorded(med_day)
+        key = (payload.user_id, med_day)
+        if key not in self._recorded:
+            return
+        self._recorded.discard(key)
+        self._write_queue.put_nowait(("delete", payload.user_id, med_day))
 
 async def setup(bot):
     await bot.add_cog(MeditationCog(bot))
\ No newline at end of file